@@ -53,6 +53,10 @@ class FinalProjectStack(cdk.Stack):
             assign_public_ip=True,
         )
 
+        # Read the service and target group once; each access is a jsii round trip
+        fargate_service = service.service
+        target_group = service.target_group
+
         # Create an Application Load Balancer
         alb = elbv2.ApplicationLoadBalancer(
             self,
@@ -66,19 +70,19 @@ class FinalProjectStack(cdk.Stack):
             "MyListener",
             port=80,
             open=True,
-            default_action=elbv2.ListenerAction.forward([service.target_group])
+            default_action=elbv2.ListenerAction.forward([target_group])
         )
 
 
         # Configure Auto Scaling for the service
-        scalable_target = service.service.auto_scale_task_count(min_capacity=1, max_capacity=3)
+        scalable_target = fargate_service.auto_scale_task_count(min_capacity=1, max_capacity=3)
         scalable_target.scale_on_cpu_utilization(
             "CpuScaling",
             target_utilization_percent=50,
         )
 
         # Configure security group to allow traffic on port 25565
-        service.service.connections.allow_from_any_ipv4(ec2.Port.tcp(25565))
+        fargate_service.connections.allow_from_any_ipv4(ec2.Port.tcp(25565))
 
         db_cluster = rds.DatabaseCluster(
             self,
@@ -96,7 +100,7 @@ class FinalProjectStack(cdk.Stack):
         )
 
         # Configure security group to allow traffic from the Minecraft server to the database
-        db_cluster.connections.allow_from(service.service, ec2.Port.tcp(3306))
+        db_cluster.connections.allow_from(fargate_service, ec2.Port.tcp(3306))
 
         # Define a domain name for the Minecraft server
         domain_name = "allynak.infracourse.cloud"  # Replace with your desired domain name
@@ -130,7 +134,7 @@ class FinalProjectStack(cdk.Stack):
         # Configure the HTTPS listener to forward traffic to the target group
         https_listener.add_target_groups(
             "MyTargetGroup",
-            target_groups=[service.target_group],
+            target_groups=[target_group],
         )
 
         # Create an A record for the domain pointing to the load balancer